@@ -1,7 +1,15 @@
-"""Top-level package for cloup."""
+"""Top-level package for cloup.
+
+Public names are imported lazily (PEP 562) on first attribute access, so that
+``import cloup`` doesn't pay the import cost of modules the CLI never uses.
+"""
 # WARNING: _version.py is generated by setuptools-scm upon package building/installation
 from __future__ import annotations
 
+import importlib as _importlib
+from typing import Any as _Any
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
 from . import _version
 
 __author__ = """Gianluca Gippetto"""
@@ -9,62 +17,163 @@ __email__ = 'gianluca.gippetto@gmail.com'
 __version__ = _version.version
 __version_tuple__ = _version.version_tuple
 
-from click import (
+if _TYPE_CHECKING:
+    from click import (
+        # decorators
+        confirmation_option,
+        help_option,
+        pass_context,
+        pass_obj,
+        password_option,
+        version_option,
+        # types
+        BOOL,
+        File,
+        FLOAT,
+        FloatRange,
+        INT,
+        IntRange,
+        ParamType,
+        Path,
+        STRING,
+        Tuple,
+        UNPROCESSED,
+        UUID,
+    )
+
+    from . import constraints  # noqa: F401
+    from . import formatting  # noqa: F401
+    from . import styling  # noqa: F401
+    from . import types  # noqa: F401
+    from . import typing  # noqa: F401
+    from . import warnings
+    from .styling import (
+        HelpTheme,
+        Style,
+        Color,
+    )
+    from .formatting import (
+        HelpFormatter,
+        HelpSection,
+    )
+    from ._context import Context
+    from ._params import Argument, Option, argument, option
+    from ._option_groups import (
+        OptionGroup,
+        OptionGroupMixin,
+        option_group,
+    )
+    from ._sections import (
+        Section,
+        SectionMixin,
+    )
+    from ._commands import (
+        Command,
+        Group,
+        command,
+        group,
+    )
+    from .constraints import (
+        ConstraintMixin,
+        constrained_params,
+        constraint,
+    )
+    from .types import dir_path, file_path, path, Choice, DateTime, Integer, JSON, JSONPath, JSONString, Real
+
+# Names re-exported as they are from Click
+_CLICK_NAMES = frozenset({
     # decorators
-    confirmation_option,
-    help_option,
-    pass_context,
-    pass_obj,
-    password_option,
-    version_option,
+    'confirmation_option',
+    'help_option',
+    'pass_context',
+    'pass_obj',
+    'password_option',
+    'version_option',
     # types
-    BOOL,
-    File,
-    FLOAT,
-    FloatRange,
-    INT,
-    IntRange,
-    ParamType,
-    Path,
-    STRING,
-    Tuple,
-    UNPROCESSED,
-    UUID,
-)
-
-from . import warnings
-from .styling import (
-    HelpTheme,
-    Style,
-    Color,
-)
-from .formatting import (
-    HelpFormatter,
-    HelpSection,
-)
-from ._context import Context
-from ._params import Argument, Option, argument, option
-from ._option_groups import (
-    OptionGroup,
-    OptionGroupMixin,
-    option_group,
-)
-from ._sections import (
-    Section,
-    SectionMixin,
-)
-from ._commands import (
-    Command,
-    Group,
-    command,
-    group,
-)
-from .constraints import (
-    ConstraintMixin,
-    constrained_params,
-    constraint,
-)
-from .types import dir_path, file_path, path, Choice, DateTime, Integer, JSON, JSONPath, JSONString, Real
+    'BOOL',
+    'File',
+    'FLOAT',
+    'FloatRange',
+    'INT',
+    'IntRange',
+    'ParamType',
+    'Path',
+    'STRING',
+    'Tuple',
+    'UNPROCESSED',
+    'UUID',
+})
+
+# Maps each lazily loaded Cloup name to the module it's imported from. A name that
+# is also the last component of its module name (e.g. "warnings") refers to the
+# submodule itself.
+_LAZY: dict[str, str] = {
+    # Submodules
+    'constraints': '.constraints',
+    'formatting': '.formatting',
+    'styling': '.styling',
+    'types': '.types',
+    'typing': '.typing',
+    'warnings': '.warnings',
+    # Cloup
+    'HelpTheme': '.styling',
+    'Style': '.styling',
+    'Color': '.styling',
+    'HelpFormatter': '.formatting',
+    'HelpSection': '.formatting',
+    'Context': '._context',
+    'Argument': '._params',
+    'Option': '._params',
+    'argument': '._params',
+    'option': '._params',
+    'OptionGroup': '._option_groups',
+    'OptionGroupMixin': '._option_groups',
+    'option_group': '._option_groups',
+    'Section': '._sections',
+    'SectionMixin': '._sections',
+    'Command': '._commands',
+    'Group': '._commands',
+    'command': '._commands',
+    'group': '._commands',
+    'ConstraintMixin': '.constraints',
+    'constrained_params': '.constraints',
+    'constraint': '.constraints',
+    'dir_path': '.types',
+    'file_path': '.types',
+    'path': '.types',
+    'Choice': '.types',
+    'DateTime': '.types',
+    'Integer': '.types',
+    'JSON': '.types',
+    'JSONPath': '.types',
+    'JSONString': '.types',
+    'Real': '.types',
+}
+
+
+def __getattr__(name: str) -> _Any:
+    if name in _CLICK_NAMES:
+        import click
+
+        value: _Any = getattr(click, name)
+        globals()[name] = value
+        return value
+
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    module = _importlib.import_module(module_name, __name__)
+    if module.__name__ == f'{__name__}.{name}':
+        value = module
+    else:
+        value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     'Argument',
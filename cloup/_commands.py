@@ -42,6 +42,7 @@ from ._option_groups import OptionGroupMixin
 from ._sections import Section
 from ._sections import SectionMixin
 from ._util import click_version_ge_8_1
+from ._util import collapse_sgr
 from ._util import first_bool
 from ._util import reindent
 from .constraints import ConstraintMixin
@@ -246,7 +247,7 @@ class Group(SectionMixin, Command, click.Group):
         if secondary_style is None or secondary_style == theme.alias:
             return theme.alias(f"({', '.join(aliases)})")
         else:
-            return (
+            return collapse_sgr(
                 secondary_style('(')
                 + secondary_style(', ').join(theme.alias(alias) for alias in aliases)
                 + secondary_style(')')
@@ -3,12 +3,12 @@ Implements the "option groups" feature.
 """
 from __future__ import annotations
 
-from collections import defaultdict
 from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import Sequence
 from typing import Any
 from typing import Callable
+from typing import cast
 from typing import overload
 from typing import TYPE_CHECKING
 
@@ -18,7 +18,6 @@ from click import Parameter
 
 import cloup
 from cloup._params import option
-from cloup._util import first_bool
 from cloup._util import make_repr
 from cloup.constraints import Constraint
 from cloup.formatting import ensure_is_cloup_formatter
@@ -35,6 +34,8 @@ PostParseCallback = Callable[[click.Context], None]
 
 
 class OptionGroup:
+    __slots__ = ('title', 'help', '_options', 'constraint', 'hidden', 'post_parse_callback')
+
     def __init__(
         self,
         title: str,
@@ -69,18 +70,26 @@ class OptionGroup:
 
     @options.setter
     def options(self, options: Iterable[click.Option]) -> None:
-        self._options = opts = tuple(options)
-        if self.hidden:
-            for opt in opts:
+        # Materialize the options and check whether they are all hidden in one pass
+        group_hidden = self.hidden
+        all_hidden = True
+        opts = []
+        for opt in options:
+            if group_hidden:
                 opt.hidden = True
-        elif all(opt.hidden for opt in opts):
+            elif not opt.hidden:
+                all_hidden = False
+            opts.append(opt)
+        self._options = tuple(opts)
+        if all_hidden:
             self.hidden = True
 
     def get_help_records(self, ctx: click.Context) -> list[tuple[str, str]]:
         if self.hidden:
             return []
+        # Iterate the options tuple directly, skipping __iter__ and the property
         return [
-            opt.get_help_record(ctx) for opt in self if not opt.hidden  # type: ignore
+            opt.get_help_record(ctx) for opt in self._options if not opt.hidden  # type: ignore
         ]  # get_help_record() should return None only if opt.hidden
 
     def option(self, *param_decls: str, **attrs: Any) -> Callable[[F], F]:
@@ -103,12 +112,16 @@ class OptionGroup:
         return make_repr(self, self.title, options=[opt.name for opt in self.options])
 
 
+# The group is always stored as an instance attribute (see ``cloup.option``
+# and ``@option_group``), so we read the instance dict directly instead of
+# going through the full attribute lookup machinery for each parameter.
+
 def has_option_group(param: click.Parameter) -> bool:
-    return getattr(param, 'group', None) is not None
+    return param.__dict__.get('group') is not None
 
 
 def get_option_group_of(param: click.Option) -> OptionGroup | None:
-    return getattr(param, 'group', None)
+    return param.__dict__.get('group')
 
 
 # noinspection PyMethodMayBeStatic
@@ -153,26 +166,40 @@ class OptionGroupMixin:
         super().__init__(*args, **kwargs)
 
         self.align_option_groups = align_option_groups
-        params = kwargs.get('params') or []
-        arguments, option_groups, ungrouped_options = self._group_params(params)
+        params = kwargs.get('params')
+        if params:
+            arguments, option_groups, ungrouped_options = self._group_params(params)
+        else:
+            # Nothing to group, e.g. for groups that only dispatch to subcommands
+            arguments, option_groups, ungrouped_options = (), (), ()
 
         self.arguments = arguments
+        """Tuple of all positional arguments."""
 
         self.option_groups = option_groups
-        """List of all option groups, except the "default option group"."""
+        """Tuple of all option groups, except the "default option group"."""
 
         self.ungrouped_options = ungrouped_options
-        """List of options not explicitly assigned to an user-defined option group.
+        """Tuple of options not explicitly assigned to an user-defined option group.
         These options will be included in the "default option group".
-        **Note:** this list does not include options added automatically by Click
+        **Note:** this tuple does not include options added automatically by Click
         based on context settings, like the ``--help`` option; use the
         :meth:`get_ungrouped_options` method if you need the real full list
         (which needs a ``Context`` object)."""
 
+        # Collect the post-parse callbacks once, so parse_args() doesn't have to
+        # check every option group on each invocation
+        self._post_parse_callbacks: tuple[PostParseCallback, ...] = tuple(
+            grp.post_parse_callback for grp in option_groups if grp.post_parse_callback is not None
+        )
+
     @staticmethod
-    def _group_params(params: list[Parameter]) -> tuple[list[click.Argument], list[OptionGroup], list[Option]]:
+    def _group_params(
+        params: list[Parameter],
+    ) -> tuple[tuple[click.Argument, ...], tuple[OptionGroup, ...], tuple[Option, ...]]:
 
-        options_by_group: dict[OptionGroup, list[click.Option]] = defaultdict(list)
+        # A plain dict preserves the order in which groups are first seen
+        options_by_group: dict[OptionGroup, list[click.Option]] = {}
         arguments: list[click.Argument] = []
         ungrouped_options: list[click.Option] = []
         for param in params:
@@ -182,26 +209,40 @@ class OptionGroupMixin:
                 grp = get_option_group_of(param)
                 if grp is None:
                     ungrouped_options.append(param)
-                else:
+                elif grp in options_by_group:
                     options_by_group[grp].append(param)
+                else:
+                    options_by_group[grp] = [param]
 
-        option_groups = list(options_by_group.keys())
         for group, options in options_by_group.items():
             group.options = options
 
-        return arguments, option_groups, ungrouped_options
+        return tuple(arguments), tuple(options_by_group), tuple(ungrouped_options)
 
     def get_ungrouped_options(self, ctx: click.Context) -> Sequence[click.Option]:
         """
         Return options not explicitly assigned to an option group
         (eventually including the ``--help`` option), i.e. options that will be
         part of the "default option group".
+
+        The result is cached on the context of this command, since
+        ``get_help_option`` creates a new ``Option`` each time it's called.
         """
+        is_own_ctx = ctx.command is cast(object, self)
+        if is_own_ctx:
+            cached = getattr(ctx, '_cloup_ungrouped_options', None)
+            if cached is not None:
+                return cast(Sequence[click.Option], cached)
+
         help_option = ctx.command.get_help_option(ctx)
         if help_option is not None:
-            return self.ungrouped_options + [help_option]
+            options = (*self.ungrouped_options, help_option)
         else:
-            return self.ungrouped_options
+            options = self.ungrouped_options
+
+        if is_own_ctx:
+            setattr(ctx, '_cloup_ungrouped_options', options)
+        return options
 
     def get_argument_help_record(self, arg: click.Argument, ctx: click.Context) -> tuple[str, str]:
         if isinstance(arg, cloup.Argument):
@@ -211,26 +252,15 @@ class OptionGroupMixin:
     def get_arguments_help_section(self, ctx: click.Context) -> HelpSection | None:
         args_to_show: list[Argument] = []
         for arg in self.arguments:
-
-            # `hidden` takes first priority
-            try:
-                hidden = getattr(arg, 'hidden')
-            except AttributeError:
-                pass
-            else:
-                if (hidden is not None) and (not hidden):
-                    args_to_show.append(arg)
-
-            # Only include arg if it has `help`
-            try:
-                help = getattr(arg, 'help')
-            except AttributeError:
-                pass
-            else:
-                if help is not None:
+            # `hidden` takes priority; if it's not set, show only args with `help`
+            hidden = getattr(arg, 'hidden', None)
+            if hidden is None:
+                if getattr(arg, 'help', None) is not None:
                     args_to_show.append(arg)
+            elif not hidden:
+                args_to_show.append(arg)
 
-        if not any(args_to_show):
+        if not args_to_show:
             return None
 
         return HelpSection(
@@ -260,11 +290,13 @@ class OptionGroupMixin:
 
         .. versionadded:: 0.8.0
         """
-        return first_bool(
-            self.align_option_groups,
-            getattr(ctx, 'align_option_groups', None),
-            default,
-        )
+        if self.align_option_groups is not None:
+            return self.align_option_groups
+        if ctx is not None:
+            ctx_value: bool | None = getattr(ctx, 'align_option_groups', None)
+            if ctx_value is not None:
+                return ctx_value
+        return default
 
     def get_default_option_group(
         self, ctx: click.Context, is_the_only_visible_option_group: bool = False
@@ -290,14 +322,16 @@ class OptionGroupMixin:
             visible_sections.append(positional_arguments_section)
 
         # Option groups
-        option_group_sections = [
-            self.make_option_group_help_section(group, ctx) for group in self.option_groups if not group.hidden
-        ]
-        default_group = self.get_default_option_group(ctx, is_the_only_visible_option_group=not option_group_sections)
+        any_visible_option_group = False
+        for group in self.option_groups:
+            if not group.hidden:
+                visible_sections.append(self.make_option_group_help_section(group, ctx))
+                any_visible_option_group = True
+        default_group = self.get_default_option_group(
+            ctx, is_the_only_visible_option_group=not any_visible_option_group
+        )
         if not default_group.hidden:
-            option_group_sections.append(self.make_option_group_help_section(default_group, ctx))
-
-        visible_sections += option_group_sections
+            visible_sections.append(self.make_option_group_help_section(default_group, ctx))
 
         formatter.write_many_sections(
             visible_sections,
@@ -308,9 +342,8 @@ class OptionGroupMixin:
         args = super().parse_args(ctx, args)        # type: ignore
 
         # Run any post-parse callbacks from option groups attached to a command
-        for option_group in self.option_groups:
-            if option_group.post_parse_callback:
-                option_group.post_parse_callback(ctx)
+        for callback in self._post_parse_callbacks:
+            callback(ctx)
 
         return args
 
@@ -404,14 +437,14 @@ def _option_group(
             hidden=hidden,
             post_parse_callback=post_parse_callback,
         )
-        if not hasattr(f, '__click_params__'):
-            f.__click_params__ = []  # type: ignore
-        cli_params = f.__click_params__  # type: ignore
+        cli_params = getattr(f, '__click_params__', None)
+        if cli_params is None:
+            cli_params = f.__click_params__ = []  # type: ignore
         for add_option in reversed(options):
             prev_len = len(cli_params)
             add_option(f)
-            added_options = cli_params[prev_len:]
-            for new_option in added_options:
+            for i in range(prev_len, len(cli_params)):
+                new_option = cli_params[i]
                 if not isinstance(new_option, Option):
                     raise TypeError('only parameter of type `Option` can be added to option groups')
                 existing_group = get_option_group_of(new_option)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import inspect
+import functools
 from collections.abc import Sequence
 from gettext import gettext as _
+from types import FunctionType
 from typing import Any
 from typing import Callable
 from typing import TYPE_CHECKING
@@ -17,6 +18,7 @@ from click.types import _NumberRangeBase
 
 if TYPE_CHECKING:
     from click.parser import OptionParser
+    from click.parser import ParsingState
     from cloup import Context
     from cloup._commands import Command
     from cloup._option_groups import OptionGroup
@@ -25,14 +27,31 @@ if TYPE_CHECKING:
 FC = TypeVar('FC', bound=Union[Callable[..., Any], 'Command'])
 
 
+@functools.lru_cache(maxsize=1024)
+def _join_options(opts: tuple[str, ...]) -> tuple[str, bool]:
+    """Cached :func:`click.formatting.join_options`; options' names don't change after creation."""
+    return join_options(opts)
+
+
+def _write_opts(opts: Sequence[str], metavar: str | None) -> tuple[str, bool]:
+    """
+    Join the parameter declarations and append the metavar (if any), as in :meth:`click.Option.get_help_record`.
+    Return the resulting string and whether any of the declarations has a slash prefix.
+    """
+    rv, any_slashes = _join_options(tuple(opts))
+    if metavar is not None:
+        rv += f' {metavar}'
+    return rv, any_slashes
+
+
 class Argument(click.Argument):
     """
     A :class:`click.Argument` with help text.
 
     :param help: help text shown next to argument
-    :param hidden: hide this argument from help output. If the argument has no help text, it is hidden by default, and
-                   setting this to True will show it. If the argument has help text, it is shown by default, and setting
-                   this to False will hide it
+    :param hidden: hide this argument from help output. If not set, the argument is shown only if it has help text.
+                   Setting this to True hides it even if it has help text, and setting this to False shows it even
+                   without help text
     :param show_default: show the default value for this argument in its help text. Values are not shown by default,
                          unless :attr:`Context.show_default` is ``True``. If this value is a string, it shows that
                          string in parentheses instead of the actual value. This is particularly useful for
@@ -60,33 +79,17 @@ class Argument(click.Argument):
 
         :param ctx: :class:`click.Context`
         """
-        any_prefix_is_slash = False
-
-        def _write_opts(opts: Sequence[str]) -> str:
-            nonlocal any_prefix_is_slash
-            rv, any_slashes = join_options(opts)
-            if any_slashes:
-                any_prefix_is_slash = True
-            rv += f' {self.make_metavar()}'
-            return rv
-
-        rv = [_write_opts(self.opts)]
+        metavar = self.make_metavar()
+        opts_str, any_prefix_is_slash = _write_opts(self.opts, metavar)
+        rv = [opts_str]
         if self.secondary_opts:
-            rv.append(_write_opts(self.secondary_opts))
+            secondary_opts_str, any_slashes = _write_opts(self.secondary_opts, metavar)
+            rv.append(secondary_opts_str)
+            any_prefix_is_slash |= any_slashes
 
         help = self.help or ''
         extra: list[str] = []
 
-        # Temporarily enable resilient parsing to avoid type casting failing for the default
-        resilient = ctx.resilient_parsing
-        ctx.resilient_parsing = True
-
-        # Retrieve default value
-        try:
-            default_value = self.get_default(ctx, call=False)
-        finally:
-            ctx.resilient_parsing = resilient
-
         # Determine if we should show the default value
         show_default = False
         show_default_is_str = False
@@ -99,19 +102,30 @@ class Argument(click.Argument):
         elif ctx.show_default is not None:
             show_default = ctx.show_default
 
+        # Retrieve default value, only if it's going to be shown
+        default_value = None
+        if show_default and not show_default_is_str:
+            # Temporarily enable resilient parsing to avoid type casting failing for the default
+            resilient = ctx.resilient_parsing
+            ctx.resilient_parsing = True
+            try:
+                default_value = self.get_default(ctx, call=False)
+            finally:
+                ctx.resilient_parsing = resilient
+
         # Add default info to help text extras
         if show_default_is_str or (show_default and (default_value is not None)):
             if show_default_is_str:
                 default_string = f'({self.show_default})'
             elif isinstance(default_value, (list, tuple)):
                 default_string = ', '.join(str(d) for d in default_value)
-            elif inspect.isfunction(default_value):
+            elif isinstance(default_value, FunctionType):
                 default_string = _('(dynamic)')
             else:
                 default_string = str(default_value)
 
             if default_string:
-                extra.append(_(f'default: {default_string}'))
+                extra.append(_('default: {default}').format(default=default_string))
 
         # Include description of value range if type is a range of numbers
         if (
@@ -163,6 +177,7 @@ class Option(click.Option):
 
         self._previous_parser_process = None
         self._eat_all_parser = None
+        self._eat_all_prefixes: tuple[str, ...] = ()
 
     def add_to_parser(self, parser: OptionParser, ctx: Context) -> None:
         """
@@ -170,33 +185,40 @@ class Option(click.Option):
 
         Idea pulled from https://stackoverflow.com/a/48394004
         """
-        def parser_process(value, state):
-            nonlocal self
-            if self._consume_arbitrary_nargs:
-                done = False
-                value = [value]
-
-                # Grab everything up to the next option¡
-                while state.rargs and not done:
-                    for prefix in self._eat_all_parser.prefixes:
-                        if state.rargs[0].startswith(prefix):
-                            done = True
-                    if not done:
-                        value.append(state.rargs.pop(0))
-
-                value = tuple(value)
-
-            # Call the actual process
-            self._previous_parser_process(value, state)
-
         super().add_to_parser(parser, ctx)
-        for name in self.opts:
-            our_parser = parser._long_opt.get(name) or parser._short_opt.get(name)
-            if our_parser:
-                self._eat_all_parser = our_parser
-                self._previous_parser_process = our_parser.process
-                our_parser.process = parser_process
-                break
+
+        # Options with a fixed number of values are processed by Click as usual
+        if not self._consume_arbitrary_nargs:
+            return
+
+        # All the names of an option are registered to the same parser option
+        name = self.opts[0]
+        our_parser = parser._long_opt.get(name) or parser._short_opt.get(name)
+        if our_parser is None:
+            return
+
+        # str.startswith() accepts a tuple, checking all prefixes in a single call
+        self._eat_all_prefixes = tuple(our_parser.prefixes)
+        self._eat_all_parser = our_parser
+        self._previous_parser_process = our_parser.process
+        our_parser.process = self._process_arbitrary_nargs
+
+    def _process_arbitrary_nargs(self, value: Any, state: ParsingState) -> None:
+        """Replacement of the parser ``process`` method for options with ``nargs=-1``."""
+        rargs = state.rargs
+
+        # Grab everything up to the next option. Find where it starts first, then
+        # remove all the values at once: popping them one by one from the front of
+        # the list would shift the remaining args every time
+        prefixes = self._eat_all_prefixes
+        end = 0
+        while end < len(rargs) and not rargs[end].startswith(prefixes):
+            end += 1
+        values = (value, *rargs[:end])
+        del rargs[:end]
+
+        # Call the actual process
+        self._previous_parser_process(values, state)
 
     def get_help_record(self, ctx: Context) -> tuple[str, str] | None:
         """
@@ -210,20 +232,13 @@ class Option(click.Option):
         if self.hidden:
             return None
 
-        any_prefix_is_slash = False
-
-        def _write_opts(opts: Sequence[str]) -> str:
-            nonlocal any_prefix_is_slash
-            rv, any_slashes = join_options(opts)
-            if any_slashes:
-                any_prefix_is_slash = True
-            if not self.is_flag and not self.count:
-                rv += f' {self.make_metavar()}'
-            return rv
-
-        rv = [_write_opts(self.opts)]
+        metavar = None if (self.is_flag or self.count) else self.make_metavar()
+        opts_str, any_prefix_is_slash = _write_opts(self.opts, metavar)
+        rv = [opts_str]
         if self.secondary_opts:
-            rv.append(_write_opts(self.secondary_opts))
+            secondary_opts_str, any_slashes = _write_opts(self.secondary_opts, metavar)
+            rv.append(secondary_opts_str)
+            any_prefix_is_slash |= any_slashes
 
         help = self.help or ''
         extra = []
@@ -246,17 +261,6 @@ class Option(click.Option):
                 )
                 extra.append(_('env var: {var}').format(var=var_str))
 
-        # Temporarily enable resilient parsing to avoid type casting
-        # failing for the default. Might be possible to extend this to
-        # help formatting in general.
-        resilient = ctx.resilient_parsing
-        ctx.resilient_parsing = True
-
-        try:
-            default_value = self.get_default(ctx, call=False)
-        finally:
-            ctx.resilient_parsing = resilient
-
         show_default = False
         show_default_is_str = False
 
@@ -268,12 +272,25 @@ class Option(click.Option):
         elif ctx.show_default is not None:
             show_default = ctx.show_default
 
+        # The default value is only needed if it's going to be shown
+        default_value = None
+        if show_default and not show_default_is_str:
+            # Temporarily enable resilient parsing to avoid type casting
+            # failing for the default. Might be possible to extend this to
+            # help formatting in general.
+            resilient = ctx.resilient_parsing
+            ctx.resilient_parsing = True
+            try:
+                default_value = self.get_default(ctx, call=False)
+            finally:
+                ctx.resilient_parsing = resilient
+
         if show_default_is_str or (show_default and (default_value is not None)):
             if show_default_is_str:
                 default_string = f'({self.show_default})'
             elif isinstance(default_value, (list, tuple)):
                 default_string = ', '.join(str(d) for d in default_value)
-            elif inspect.isfunction(default_value):
+            elif isinstance(default_value, FunctionType):
                 default_string = _('(dynamic)')
             elif self.is_bool_flag and self.secondary_opts:
                 # For boolean flags that have distinct True/False opts,
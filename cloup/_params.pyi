@@ -21,7 +21,14 @@ ShellCompleteArg = Callable[
 ]
 
 class Argument(click.Argument):
-    def __init__(self, *args: Any, help: Optional[str] = None, **attrs: Any): ...
+    def __init__(
+        self,
+        *args: Any,
+        help: Optional[str] = None,
+        hidden: Optional[bool] = None,
+        show_default: Optional[Union[bool, str]] = None,
+        **attrs: Any
+    ): ...
     def get_help_record(self, ctx: click.Context) -> Tuple[str, str]: ...
 
 class Option(click.Option):
@@ -31,6 +38,8 @@ def argument(
     *param_decls: str,
     cls: Optional[Type[Argument]] = None,
     help: Optional[str] = None,
+    hidden: Optional[bool] = None,
+    show_default: Optional[Union[bool, str]] = None,
     type: Optional[ParamTypeLike] = None,
     required: Optional[bool] = None,
     default: Optional[ParamDefault] = None,
@@ -1,9 +1,9 @@
 """Generic utilities."""
 from __future__ import annotations
 
+import re
 from collections.abc import Hashable
 from collections.abc import Iterable
-from collections.abc import Sequence
 from typing import Any
 from typing import TypeVar
 
@@ -58,12 +58,18 @@ def make_repr(obj: Any, *args: Any, _line_len: int = 60, _indent: int = 2, **kwa
     :return: str
     """
     cls_name = obj.__class__.__name__
-    arglist = [
-        *(repr(arg) for arg in args),
-        *(f'{key}={value!r}' for key, value in kwargs.items()),
-    ]
-    len_arglist = sum(len(s) for s in arglist)
-    total_len = len(cls_name) + len_arglist + 2 * len(arglist)
+    # Build the argument strings and measure the total length in a single pass;
+    # each argument also accounts for its ", " separator (or the parenthesis).
+    arglist: list[str] = []
+    total_len = len(cls_name)
+    for arg in args:
+        arg_text = repr(arg)
+        arglist.append(arg_text)
+        total_len += len(arg_text) + 2
+    for key, value in kwargs.items():
+        arg_text = f'{key}={value!r}'
+        arglist.append(arg_text)
+        total_len += len(arg_text) + 2
     if 0 <= _line_len < total_len:
         lines = indent_lines(arglist, width=_indent)
         args_text = ',\n'.join(lines)
@@ -132,7 +138,7 @@ class FrozenSpaceMeta(type):
         return cls._dict  # type: ignore
 
     def __contains__(cls, item: str) -> bool:
-        return item in cls.asdict()
+        return item in cls._dict  # type: ignore
 
     def __getitem__(cls, item: str) -> Any:
         return cls._dict[item]  # type: ignore
@@ -145,9 +151,26 @@ class FrozenSpace(metaclass=FrozenSpaceMeta):
         raise Exception("this class is just a namespace for constants, it's not instantiable.")
 
 
-def delete_keys(d: dict[Any, Any], keys: Sequence[str]) -> None:
-    for key in keys:
-        del d[key]
+_SGR_RUN = re.compile(r'(?:\x1b\[[0-9;]*m){2,}')
+_SGR_PARAMS = re.compile(r'\x1b\[([0-9;]*)m')
+
+
+def _merge_sgr_run(match: re.Match[str]) -> str:
+    params = _SGR_PARAMS.findall(match.group())
+    # A reset cancels the effect of all the sequences preceding it
+    for i in range(len(params) - 1, -1, -1):
+        if params[i] in ('', '0'):
+            params = params[i:]
+            break
+    return '\x1b[' + ';'.join(p or '0' for p in params) + 'm'
+
+
+def collapse_sgr(text: str) -> str:
+    """Merge each run of consecutive ANSI SGR sequences (e.g. a reset followed
+    by a color) into a single equivalent sequence."""
+    if '\x1b' not in text:
+        return text
+    return _SGR_RUN.sub(_merge_sgr_run, text)
 
 
 def reindent(text: str, indent: int = 0) -> str:
@@ -1,41 +1,110 @@
 """
 Constraints for parameter groups.
 
+Public names are imported lazily on first access (see ``cloup/__init__.py``).
+
 .. versionadded:: v0.5.0
 """
 from __future__ import annotations
 
-from ._conditional import If
-from ._core import accept_none
-from ._core import AcceptAtMost
-from ._core import AcceptBetween
-from ._core import all_or_none
-from ._core import And
-from ._core import Constraint
-from ._core import ErrorFmt
-from ._core import ErrorRephraser
-from ._core import HelpRephraser
-from ._core import mutually_exclusive
-from ._core import Operator
-from ._core import Or
-from ._core import Rephraser
-from ._core import require_all
-from ._core import require_any
-from ._core import require_one
-from ._core import RequireAtLeast
-from ._core import RequireExactly
-from ._core import WrapperConstraint
-from ._support import BoundConstraintSpec
-from ._support import constrained_params
-from ._support import constraint
-from ._support import ConstraintMixin
-from .conditions import AllSet
-from .conditions import AnySet
-from .conditions import Equal
-from .conditions import IsSet
-from .conditions import Not
-from .exceptions import ConstraintViolated
-from .exceptions import UnsatisfiableConstraint
+import importlib as _importlib
+from typing import Any as _Any
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from . import common  # noqa: F401
+    from . import conditions  # noqa: F401
+    from . import exceptions  # noqa: F401
+    from ._conditional import If
+    from ._core import accept_none
+    from ._core import AcceptAtMost
+    from ._core import AcceptBetween
+    from ._core import all_or_none
+    from ._core import And
+    from ._core import Constraint
+    from ._core import ErrorFmt
+    from ._core import ErrorRephraser
+    from ._core import HelpRephraser
+    from ._core import mutually_exclusive
+    from ._core import Operator
+    from ._core import Or
+    from ._core import Rephraser
+    from ._core import require_all
+    from ._core import require_any
+    from ._core import require_one
+    from ._core import RequireAtLeast
+    from ._core import RequireExactly
+    from ._core import WrapperConstraint
+    from ._support import BoundConstraintSpec
+    from ._support import constrained_params
+    from ._support import constraint
+    from ._support import ConstraintMixin
+    from .conditions import AllSet
+    from .conditions import AnySet
+    from .conditions import Equal
+    from .conditions import IsSet
+    from .conditions import Not
+    from .exceptions import ConstraintViolated
+    from .exceptions import UnsatisfiableConstraint
+
+# Maps each public name to the submodule defining it. A name that is also the
+# last component of its module name refers to the submodule itself.
+_LAZY: dict[str, str] = {
+    # Submodules
+    'common': '.common',
+    'conditions': '.conditions',
+    'exceptions': '.exceptions',
+    # Constraints
+    'If': '._conditional',
+    'accept_none': '._core',
+    'AcceptAtMost': '._core',
+    'AcceptBetween': '._core',
+    'all_or_none': '._core',
+    'And': '._core',
+    'Constraint': '._core',
+    'ErrorFmt': '._core',
+    'ErrorRephraser': '._core',
+    'HelpRephraser': '._core',
+    'mutually_exclusive': '._core',
+    'Operator': '._core',
+    'Or': '._core',
+    'Rephraser': '._core',
+    'require_all': '._core',
+    'require_any': '._core',
+    'require_one': '._core',
+    'RequireAtLeast': '._core',
+    'RequireExactly': '._core',
+    'WrapperConstraint': '._core',
+    'BoundConstraintSpec': '._support',
+    'constrained_params': '._support',
+    'constraint': '._support',
+    'ConstraintMixin': '._support',
+    'AllSet': '.conditions',
+    'AnySet': '.conditions',
+    'Equal': '.conditions',
+    'IsSet': '.conditions',
+    'Not': '.conditions',
+    'ConstraintViolated': '.exceptions',
+    'UnsatisfiableConstraint': '.exceptions',
+}
+
+
+def __getattr__(name: str) -> _Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    module = _importlib.import_module(module_name, __name__)
+    if module.__name__ == f'{__name__}.{name}':
+        value: _Any = module
+    else:
+        value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     'AcceptAtMost',
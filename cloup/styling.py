@@ -11,8 +11,7 @@ from typing import NamedTuple
 
 import click
 
-from cloup._util import click_version_tuple
-from cloup._util import delete_keys
+from cloup._util import click_major
 from cloup._util import FrozenSpace
 from cloup._util import identity
 from cloup.typing import MISSING
@@ -21,6 +20,9 @@ from cloup.typing import Possibly
 IStyle = Callable[[str], str]
 """A callable that takes a string and returns a styled version of it."""
 
+_CLICK_LT_8 = click_major < 8
+_STYLE_CACHE_SIZE = 256
+
 
 # noinspection PyUnresolvedReferences
 class HelpTheme(NamedTuple):
@@ -99,10 +101,27 @@ class HelpTheme(NamedTuple):
         alias_secondary: Possibly[IStyle | None] = MISSING,
         epilog: IStyle | None = None,
     ) -> HelpTheme:
-        kwargs = {key: val for key, val in locals().items() if val is not None}
-        if alias_secondary is MISSING:
-            del kwargs['alias_secondary']
-        kwargs.pop('self')
+        kwargs: dict[str, Any] = {}
+        if invoked_command is not None:
+            kwargs['invoked_command'] = invoked_command
+        if command_help is not None:
+            kwargs['command_help'] = command_help
+        if heading is not None:
+            kwargs['heading'] = heading
+        if constraint is not None:
+            kwargs['constraint'] = constraint
+        if section_help is not None:
+            kwargs['section_help'] = section_help
+        if col1 is not None:
+            kwargs['col1'] = col1
+        if col2 is not None:
+            kwargs['col2'] = col2
+        if alias is not None:
+            kwargs['alias'] = alias
+        if alias_secondary is not MISSING:
+            kwargs['alias_secondary'] = alias_secondary
+        if epilog is not None:
+            kwargs['epilog'] = epilog
         if kwargs:
             return self._replace(**kwargs)
         return self
@@ -176,22 +195,32 @@ class Style:
     strikethrough: bool | None = None
     text_transform: IStyle | None = None
 
-    _style_kwargs: dict[str, Any] | None = dc.field(init=False, default=None)
+    _style_kwargs: dict[str, Any] = dc.field(init=False, repr=False, compare=False)
+    _cache: dict[str, str] = dc.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        kwargs = {
+            'fg': self.fg, 'bg': self.bg, 'bold': self.bold, 'dim': self.dim,
+            'underline': self.underline, 'overline': self.overline,
+            'italic': self.italic, 'blink': self.blink, 'reverse': self.reverse,
+            'strikethrough': self.strikethrough,
+        }
+        if _CLICK_LT_8:
+            # These arguments are not supported in Click < 8. Ignore them.
+            del kwargs['overline'], kwargs['italic'], kwargs['strikethrough']
+        object.__setattr__(self, '_style_kwargs', kwargs)
+        object.__setattr__(self, '_cache', {})
 
     def __call__(self, text: str) -> str:
-        if self._style_kwargs is None:
-            kwargs = dc.asdict(self)
-            delete_keys(kwargs, ['text_transform', '_style_kwargs'])
-            if int(click_version_tuple[0]) < 8:
-                # These arguments are not supported in Click < 8. Ignore them.
-                delete_keys(kwargs, ['overline', 'italic', 'strikethrough'])
-            object.__setattr__(self, '_style_kwargs', kwargs)
-        else:
-            kwargs = self._style_kwargs
-
-        if self.text_transform:
-            text = self.text_transform(text)
-        return click.style(text, **kwargs)
+        # The same strings (option names, headings...) are styled over and over.
+        styled = self._cache.get(text)
+        if styled is None:
+            styled = self.text_transform(text) if self.text_transform else text
+            styled = click.style(styled, **self._style_kwargs)
+            if len(self._cache) >= _STYLE_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[text] = styled
+        return styled
 
 
 class Color(FrozenSpace):
@@ -3,11 +3,15 @@ Parameter types and "shortcuts" for creating commonly used types.
 """
 from __future__ import annotations
 
+import functools
+import json
 import pathlib
+from collections.abc import Iterable
 from collections.abc import Sequence
 from datetime import datetime
 from gettext import gettext as _
 from typing import Any
+from typing import Callable
 from typing import cast
 from typing import TYPE_CHECKING
 from typing import Union
@@ -52,7 +56,16 @@ def path(
     """
     Shortcut for :class:`click.Path` with ``path_type=pathlib.Path``.
     """
-    return click.Path(**locals())
+    return click.Path(
+        path_type=path_type,
+        exists=exists,
+        file_okay=file_okay,
+        dir_okay=dir_okay,
+        writable=writable,
+        readable=readable,
+        resolve_path=resolve_path,
+        allow_dash=allow_dash,
+    )
 
 
 def dir_path(
@@ -67,7 +80,15 @@ def dir_path(
     """
     Shortcut for :class:`click.Path` with ``file_okay=False, path_type=pathlib.Path``.
     """
-    return click.Path(**locals(), file_okay=False)
+    return click.Path(
+        path_type=path_type,
+        exists=exists,
+        file_okay=False,
+        writable=writable,
+        readable=readable,
+        resolve_path=resolve_path,
+        allow_dash=allow_dash,
+    )
 
 
 def file_path(
@@ -82,7 +103,15 @@ def file_path(
     """
     Shortcut for :class:`click.Path` with ``dir_okay=False, path_type=pathlib.Path``.
     """
-    return click.Path(**locals(), dir_okay=False)
+    return click.Path(
+        path_type=path_type,
+        exists=exists,
+        dir_okay=False,
+        writable=writable,
+        readable=readable,
+        resolve_path=resolve_path,
+        allow_dash=allow_dash,
+    )
 
 
 """
@@ -108,45 +137,109 @@ class Choice(_Choice):
     :param choices: choices to provide as options
     :param case_sensitive: Set to false to make choices case insensitive. Defaults to true.
     """
-    def convert(self, value: Any, param: Parameter | None, ctx: Context | None) -> str:
-        normed_value = value
-        normed_choices = {choice: choice for choice in self.choices}
+    def __init__(self, choices: Sequence[str], case_sensitive: bool = True) -> None:
+        super().__init__(choices, case_sensitive=case_sensitive)
+        # Normalized choice -> original choice, used when there's no token_normalize_func
+        self._normed_choices = self._normalize_choices(self.choices)
+        self._choices_str = ', '.join(self.choices)
+        # Last (token_normalize_func, normalized choices) pair, reused across calls
+        self._token_normed_choices: tuple[Callable[[str], str] | None, dict[str, str]] = (None, {})
+
+    def _normalize_choices(self, normed_choices: Iterable[str]) -> dict[str, str]:
+        if self.case_sensitive:
+            return dict(zip(normed_choices, self.choices))
+        return dict(zip(map(str.casefold, normed_choices), self.choices))
+
+    def _get_normed_choices(self, token_normalize_func: Callable[[str], str] | None) -> dict[str, str]:
+        if token_normalize_func is None:
+            return self._normed_choices
+        cached_func, normed_choices = self._token_normed_choices
+        if cached_func is not token_normalize_func:
+            normed_choices = self._normalize_choices(map(token_normalize_func, self.choices))
+            self._token_normed_choices = (token_normalize_func, normed_choices)
+        return normed_choices
+
+    def _normalize_value(self, value: str, token_normalize_func: Callable[[str], str] | None) -> str:
+        if token_normalize_func is not None:
+            value = token_normalize_func(value)
+        return value if self.case_sensitive else str.casefold(value)
+
+    def convert(self, value: Any, param: Parameter | None, ctx: Context | None) -> Any:
+        token_normalize_func = ctx.token_normalize_func if ctx is not None else None
+        normed_choices = self._get_normed_choices(token_normalize_func)
+        # Common case: values are looked up as they are
+        no_normalization = token_normalize_func is None and self.case_sensitive
 
         consume_arbitrary_args = hasattr(param, '_consume_arbitrary_nargs')
         consume_arbitrary_args = consume_arbitrary_args and param._consume_arbitrary_nargs  # type: ignore
 
-        if (ctx is not None) and (ctx.token_normalize_func is not None):
-            normed_value = ctx.token_normalize_func(value)
-            normed_choices = {
-                ctx.token_normalize_func(normed_choice): original
-                for normed_choice, original in normed_choices.items()
-            }
-
-        if not self.case_sensitive:  # type: ignore
-            if consume_arbitrary_args:
-                normed_value = tuple(str.casefold(value) for value in normed_value)
-            else:
-                normed_value = str.casefold(normed_value)
-
-            normed_choices = {
-                str.casefold(normed_choice): original
-                for normed_choice, original in normed_choices.items()
-            }
-
         if consume_arbitrary_args:
-            for value_item in normed_value:
-                if value_item not in normed_choices:
+            # Normalize and check each value in a single pass
+            originals = []
+            for value_item in value:
+                normed_item = value_item
+                if not no_normalization:
+                    normed_item = self._normalize_value(value_item, token_normalize_func)
+                original = normed_choices.get(normed_item)
+                if original is None:
                     return self.fail(
-                        _(f'invalid choice: {value_item}. (choose from {", ".join(self.choices)})'),
+                        _('invalid choice: {value}. (choose from {choices})').format(
+                            value=value_item, choices=self._choices_str
+                        ),
                         param,
                         ctx
                     )
-            else:
-                return normed_value
-        elif normed_value in normed_choices:
-            return normed_choices[normed_value]
-        else:
-            return self.fail(_(f'invalid choice: {value}. (choose from {", ".join(self.choices)})'), param, ctx)
+                originals.append(original)
+            return tuple(originals)
+
+        normed_value = value if no_normalization else self._normalize_value(value, token_normalize_func)
+        original = normed_choices.get(normed_value)
+        if original is None:
+            return self.fail(
+                _('invalid choice: {value}. (choose from {choices})').format(value=value, choices=self._choices_str),
+                param,
+                ctx
+            )
+        return original
+
+
+def _import_dateutil_parser() -> tuple[Callable[[str], datetime], type[Exception]]:
+    try:
+        from dateutil.parser import ParserError
+        from dateutil.parser import parse
+    except ImportError as e:
+        raise ImportError('python-dateutil must be installed to use_dateutil with click.DateTime') from e
+    return parse, ParserError
+
+
+@functools.lru_cache(maxsize=128)
+def _strptime_first(value: str, formats: tuple[str, ...]) -> datetime | None:
+    """Parse ``value`` with the first matching format. The result is cached since
+    the same dates are often passed over and over (e.g. by scripts)."""
+    for format in formats:
+        try:
+            return datetime.strptime(value, format)
+        except ValueError:
+            pass
+    return None
+
+
+_DEFAULT_DATETIME_FORMATS = ('%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S')
+
+
+def _parse_default_datetime(value: str) -> datetime | None:
+    """Fast path for :data:`_DEFAULT_DATETIME_FORMATS` that avoids ``strptime``.
+    Only strings shaped exactly like one of those formats are parsed."""
+    n = len(value)
+    if not (
+        (n == 10 or (n == 19 and value[10] in 'T ' and value[13] == ':' and value[16] == ':'))
+        and value[4] == '-' and value[7] == '-' and value.isascii()
+    ):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
 
 
 class DateTime(_DateTime):
@@ -174,6 +267,7 @@ class DateTime(_DateTime):
                                be shown as the option metavar
     :param use_dateutil: if True, python-dateutil will be used to parse the option value. When True, the ``formats``
                          kwarg is ignored. If `python-dateutil` is not installed, an ImportError will be raised
+                         on construction
     """
     def __init__(
         self,
@@ -184,6 +278,9 @@ class DateTime(_DateTime):
         super().__init__(formats=formats)
         self.formats_in_metavar = formats_in_metavar
         self.use_dateutil = use_dateutil
+        self._default_formats = tuple(self.formats) == _DEFAULT_DATETIME_FORMATS
+        if use_dateutil:
+            self._parse_datetime, self._parser_error = _import_dateutil_parser()
 
     def to_info_dict(self) -> dict[str, Any]:
         info_dict = super().to_info_dict()
@@ -202,18 +299,18 @@ class DateTime(_DateTime):
 
         if self.use_dateutil:
             try:
-                from dateutil.parser import parse as parse_datetime
-            except (ModuleNotFoundError, ImportError, NameError) as e:
-                raise ImportError('python-dateutil must be installed to use_dateutil with click.DateTime') from e
-            else:
-                from dateutil.parser import ParserError
-                try:
-                    return parse_datetime(value)
-                except ParserError:
-                    self.fail(_(f'{value} is not a valid datetime'), param, ctx)
+                return self._parse_datetime(value)
+            except self._parser_error:
+                self.fail(_(f'{value} is not a valid datetime'), param, ctx)
 
-        else:
-            return super().convert(value, param, ctx)
+        if isinstance(value, str):
+            converted = _parse_default_datetime(value) if self._default_formats else None
+            if converted is None:
+                converted = _strptime_first(value, tuple(self.formats))
+            if converted is not None:
+                return converted
+        # Let Click handle other values and report errors
+        return super().convert(value, param, ctx)
 
 
 """
@@ -232,6 +329,8 @@ class Integer(ParamType):
     :param base: base of integer to parse as (as accepted by the `base` arg of :func:`int`)
     :param as_str: if True, value will be validated then returned as string (instead of being converted to an int)
     """
+    __slots__ = ('base', 'as_str')
+
     def __init__(self, base: int = 10, as_str: bool = False):
         self.base = base
         self.as_str = as_str
@@ -245,6 +344,10 @@ class Integer(ParamType):
             return value if self.as_str else converted_value
 
 
+def _looks_like_json_container(value: Any) -> bool:
+    return isinstance(value, str) and value.lstrip()[:1] in ('{', '[', '"')
+
+
 class JSON(ParamType):
     """
     Parameter type that expects valid JSON and returns the parsed JSON
@@ -253,6 +356,8 @@ class JSON(ParamType):
     :param str_ok: if True, parameter value can be a str representation of JSON
     :param path_ok: if True, parameter value can be a path to a JSON file
     """
+    __slots__ = ('type', 'str_ok', 'path_ok', '_path_type')
+
     name = 'json'
 
     def __init__(
@@ -264,17 +369,22 @@ class JSON(ParamType):
         self.type = type
         self.str_ok = str_ok
         self.path_ok = path_ok
+        self._path_type = Path(exists=True, dir_okay=False, path_type=pathlib.Path) if path_ok else None
 
     def convert(self, value: str, param: click.Parameter | None, ctx: click.Context | None) -> object:
-        import json
-
         val: Any = MISSING
         path_exc: Exception | None = None
 
-        if self.path_ok:
-            path_param_type = Path(exists=True, dir_okay=False, path_type=pathlib.Path)
+        if self.str_ok and self._path_type is not None and _looks_like_json_container(value):
+            # Don't stat the filesystem for values that are clearly inline JSON
             try:
-                _path = path_param_type.convert(value, param, ctx)
+                val = json.loads(value)
+            except json.JSONDecodeError:
+                pass
+
+        if self._path_type is not None and (val is MISSING):
+            try:
+                _path = self._path_type.convert(value, param, ctx)
             except click.BadParameter as exc:
                 path_exc = exc
             else:
@@ -307,6 +417,8 @@ class JSONString(JSON):
 
     :param type: require that parsed JSON must be an instance of a specific type (list, dict, etc)
     """
+    __slots__ = ()
+
     def __init__(self, type: type | None = None):
         super().__init__(type=type, path_ok=False)
 
@@ -317,6 +429,8 @@ class JSONPath(JSON):
 
     :param type: require that parsed JSON must be an instance of a specific type (list, dict, etc)
     """
+    __slots__ = ()
+
     def __init__(self, type: type | None = None):
         super().__init__(type=type, str_ok=False)
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import io
 import random
 from pathlib import Path
 
@@ -39,7 +41,9 @@ grow, mark and tweak your common history
    tag               Create, list, delete or verify a tag object signed with GPG
 """.strip()
 
-CODE_TEMPLATE = """
+
+def render_code(max_section_count, max_commands_per_section, command_list, section_list):
+    return f"""\
 \"\"\"
 This example shows how to use ``cloup.Section`` to organize the subcommands of
 a multi-command in many ``--help`` sections.
@@ -95,9 +99,10 @@ git.add_command(cloup.command('fake-1', help='Fake command #1')(f))
 
 if __name__ == '__main__':
     git()
-""".lstrip()
+"""
 
 
+@functools.lru_cache(maxsize=1)
 def parse_help(help_text):
     sections = []
     for text in help_text.split('\n\n'):
@@ -107,48 +112,50 @@ def parse_help(help_text):
         for row in rows:
             cmd, desc = map(str.strip, row.split(' ', 1))
             commands.append((cmd, desc))
-        random.shuffle(commands)
-        sections.append([title, commands])
-    return sections
+        sections.append((title, tuple(commands)))
+    return tuple(sections)
 
 
 def get_command_var_name(cmd_name):
     return 'git_' + cmd_name.replace('-', '_')
 
 
-def generate(out_path=EXAMPLE_FILE_PATH,
-             max_section_count=MAX_SECTION_COUNT,
-             max_commands_per_section=MAX_COMMANDS_PER_SECTION):
-    sections = parse_help(GIT_HELP)[:max_section_count]
-    for s in sections:
-        s[1] = s[1][:max_commands_per_section]
+@functools.lru_cache(maxsize=None)
+def generate_code(max_section_count=MAX_SECTION_COUNT,
+                  max_commands_per_section=MAX_COMMANDS_PER_SECTION):
+    sections = []
+    for title, commands in parse_help(GIT_HELP)[:max_section_count]:
+        commands = list(commands)
+        random.shuffle(commands)
+        sections.append((title, commands[:max_commands_per_section]))
 
     # Subcommand definitions
-    commands_buffer = []
+    commands_buffer = io.StringIO()
     for _, commands in sections:
         for cmd_name, desc in commands:
             var_name = get_command_var_name(cmd_name)
-            commands_buffer.append(
-                f'{var_name} = cloup.command({cmd_name!r}, help={desc!r})(f)')
-        commands_buffer.append('')
-    commands_list = '\n'.join(commands_buffer).strip()
+            commands_buffer.write(f'{var_name} = cloup.command({cmd_name!r}, help={desc!r})(f)\n')
+        commands_buffer.write('\n')
+    commands_list = commands_buffer.getvalue().strip()
 
     # Section list
-    sections_buffer = []
+    sections_buffer = io.StringIO()
     for title, commands in sections:
-        sections_buffer.append('git.section(')
-        sections_buffer.append(f'    {title!r},')
-        for cmd_name, _ in commands:
-            var_name = get_command_var_name(cmd_name)
-            sections_buffer.append(f'    {var_name},')
-        sections_buffer.append(')')
-    section_list = '\n'.join(sections_buffer)
+        sections_buffer.write(f'git.section(\n    {title!r},\n')
+        sections_buffer.writelines(f'    {get_command_var_name(cmd_name)},\n' for cmd_name, _ in commands)
+        sections_buffer.write(')\n')
+    section_list = sections_buffer.getvalue().rstrip('\n')
+
+    return render_code(max_section_count=max_section_count,
+                       max_commands_per_section=max_commands_per_section,
+                       command_list=commands_list,
+                       section_list=section_list)
 
-    code = CODE_TEMPLATE.format(max_section_count=max_section_count,
-                                max_commands_per_section=max_commands_per_section,
-                                command_list=commands_list,
-                                section_list=section_list)
 
+def generate(out_path=EXAMPLE_FILE_PATH,
+             max_section_count=MAX_SECTION_COUNT,
+             max_commands_per_section=MAX_COMMANDS_PER_SECTION):
+    code = generate_code(max_section_count, max_commands_per_section)
     print(code)
     with open(out_path, 'w', encoding='utf-8') as out_file:
         out_file.write(code)
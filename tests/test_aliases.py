@@ -198,6 +198,7 @@ def test_alias_are_correctly_styled(runner):
     )
 
     # Both
+    # Adjacent escape sequences are merged
     assert fmt(alias=red, alias_secondary=green) == (
-        green('(') + red('i') + green(', ') + red('add') + green(')')
+        '\x1b[32m(\x1b[0;31mi\x1b[0;32m, \x1b[0;31madd\x1b[0;32m)\x1b[0m'
     )
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import cloup
+
+
+def test_import_cloup_does_not_import_submodules():
+    code = (
+        'import sys, cloup; '
+        'print(sorted(m for m in sys.modules if m == "click" or m.startswith("cloup.")))'
+    )
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+    assert output.strip() == "['cloup._version']"
+
+
+def test_commands_do_not_import_conditional_constraints():
+    code = (
+        'import sys, cloup; cloup.command; '
+        'print(sorted(m for m in sys.modules if m.startswith("cloup.constraints.")))'
+    )
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+    assert 'cloup.constraints.conditions' not in output
+    assert 'cloup.constraints._conditional' not in output
+
+
+@pytest.mark.parametrize('name', [*cloup.constraints.__all__, 'common', 'conditions', 'exceptions'])
+def test_all_public_constraints_names_are_accessible(name):
+    assert getattr(cloup.constraints, name) is not None
+
+
+@pytest.mark.parametrize('name', cloup.__all__)
+def test_all_public_names_are_accessible(name):
+    assert getattr(cloup, name) is not None
+
+
+def test_accessing_missing_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError, match='no_such_name'):
+        cloup.no_such_name  # noqa: B018
+
+
+@pytest.mark.parametrize('name', ['importlib', 'Any', 'TYPE_CHECKING'])
+@pytest.mark.parametrize('module', [cloup, cloup.constraints])
+def test_helper_imports_are_not_exposed(module, name):
+    assert not hasattr(module, name)
+    assert name not in dir(module)
@@ -138,6 +138,24 @@ def test_align_option_groups_context_setting(runner, ctx_value, cmd_value):
     assert result.output[start:end] == expected
 
 
+@pytest.mark.parametrize(
+    'cmd_value, ctx_value, expected',
+    [
+        pytest.param(None, None, 'default', id='default'),
+        pytest.param(None, False, False, id='ctx'),
+        pytest.param(True, False, True, id='cmd_over_ctx'),
+        pytest.param(False, MISSING, False, id='cmd_without_ctx'),
+    ],
+)
+def test_must_align_option_groups_priority(cmd_value, ctx_value, expected):
+    cmd = cloup.Command('cmd', align_option_groups=cmd_value)
+    if ctx_value is MISSING:
+        ctx = None
+    else:
+        ctx = cloup.Context(cmd, align_option_groups=ctx_value)
+    assert cmd.must_align_option_groups(ctx, default='default') == expected
+
+
 def test_context_settings_propagate_to_children(runner):
     @cloup.group(context_settings=dict(align_option_groups=False))
     def grp():
@@ -305,3 +323,61 @@ def test_default_option_group_title_when_the_only_other_section_is_positional_ar
           --opt TEXT  An option.
           --help      Show this message and exit.
     """)
+
+
+@pytest.mark.parametrize(
+    'arg_kwargs, expected_shown',
+    [
+        pytest.param({}, False, id='no_help'),
+        pytest.param({'help': 'Help.'}, True, id='help'),
+        pytest.param({'hidden': False}, True, id='no_help_not_hidden'),
+        pytest.param({'help': 'Help.', 'hidden': False}, True, id='help_not_hidden'),
+        pytest.param({'help': 'Help.', 'hidden': True}, False, id='help_hidden'),
+    ],
+)
+def test_arguments_help_section_respects_hidden_and_help(arg_kwargs, expected_shown):
+    @cloup.command()
+    @cloup.argument('arg', **arg_kwargs)
+    def cmd(**kwargs):
+        pass
+
+    ctx = cloup.Context(cmd)
+    section = cmd.get_arguments_help_section(ctx)
+    if expected_shown:
+        assert len(section.definitions) == 1
+    else:
+        assert section is None
+
+
+def test_get_ungrouped_options_includes_help_option_and_is_cached():
+    @cloup.command()
+    @cloup.option('--opt')
+    def cmd(**kwargs):
+        pass
+
+    ctx = cloup.Context(cmd)
+    options = cmd.get_ungrouped_options(ctx)
+    assert [opt.name for opt in options] == ['opt', 'help']
+    assert cmd.get_ungrouped_options(ctx) is options
+    assert cmd.get_ungrouped_options(cloup.Context(cmd)) is not options
+
+
+def test_post_parse_callbacks_of_option_groups_are_called_in_order(runner):
+    calls = []
+
+    @cloup.command()
+    @cloup.option_group(
+        'First', cloup.option('--one'),
+        post_parse_callback=lambda ctx: calls.append(('first', ctx.params['one'])),
+    )
+    @cloup.option_group('Second', cloup.option('--two'))
+    @cloup.option_group(
+        'Third', cloup.option('--three'),
+        post_parse_callback=lambda ctx: calls.append(('third', ctx.params['three'])),
+    )
+    def cmd(**kwargs):
+        calls.append(('cmd', None))
+
+    res = runner.invoke(cmd, ['--one', '1', '--three', '3'])
+    assert res.exit_code == 0, res.output
+    assert calls == [('first', '1'), ('third', '3'), ('cmd', None)]
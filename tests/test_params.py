@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import pytest
+
+import cloup
+
+
+@pytest.fixture()
+def nargs_cmd():
+    @cloup.command()
+    @cloup.option('--many', nargs=-1, type=cloup.Choice(['a', 'b', 'c']))
+    @cloup.option('-x', '--ex')
+    @cloup.argument('rest', nargs=-1)
+    def cmd(**kwargs):
+        print(kwargs)
+
+    return cmd
+
+
+@pytest.mark.parametrize(
+    'args, expected',
+    [
+        pytest.param(['--many', 'a'], ('a',), id='one'),
+        pytest.param(['--many', 'a', 'b', 'c'], ('a', 'b', 'c'), id='many'),
+        pytest.param(['--many', 'a', 'b', '-x', '1'], ('a', 'b'), id='stop_at_short_option'),
+        pytest.param(['--many', 'a', '--ex=1', 'z'], ('a',), id='stop_at_long_option'),
+        pytest.param(['-x', '1'], None, id='not_provided'),
+    ],
+)
+def test_option_with_arbitrary_nargs_consumes_values_up_to_next_option(
+    runner, nargs_cmd, args, expected
+):
+    res = runner.invoke(nargs_cmd, args)
+    assert res.exit_code == 0, res.output
+    assert f"'many': {expected!r}" in res.output
+
+
+def test_option_with_arbitrary_nargs_leaves_following_args(runner, nargs_cmd):
+    res = runner.invoke(nargs_cmd, ['--many', 'a', 'b', '-x', '1', 'y', 'z'])
+    assert res.exit_code == 0, res.output
+    assert "'ex': '1'" in res.output
+    assert "'rest': ('y', 'z')" in res.output
+
+
+def test_help_record_reflects_context_settings():
+    opt = cloup.Option(['--opt'], default=1, help='Help.')
+    cmd = cloup.Command('cmd', params=[opt])
+
+    assert opt.get_help_record(cloup.Context(cmd)) == ('--opt INTEGER', 'Help.')
+    assert opt.get_help_record(cloup.Context(cmd, show_default=True)) == (
+        '--opt INTEGER', 'Help.  [default: 1]'
+    )
+
+
+def test_help_record_reflects_default_map():
+    opt = cloup.Option(['--opt'], default=1, show_default=True)
+    cmd = cloup.Command('cmd', params=[opt])
+
+    assert opt.get_help_record(cloup.Context(cmd)) == ('--opt INTEGER', '[default: 1]')
+    ctx = cloup.Context(cmd, default_map={'opt': 2})
+    assert opt.get_help_record(ctx) == ('--opt INTEGER', '[default: 2]')
+
+
+@pytest.mark.parametrize('param_cls', [cloup.Argument, cloup.Option])
+def test_help_record_reflects_attribute_changes(param_cls):
+    decl = 'arg' if param_cls is cloup.Argument else '--opt'
+    param = param_cls([decl], default=1, help='Help.', required=False)
+    cmd = cloup.Command('cmd', params=[param])
+    ctx = cloup.Context(cmd, tag_optional_arguments=False)
+
+    assert param.get_help_record(ctx)[1] == 'Help.'
+    param.help = 'New help.'
+    param.show_default = True
+    assert param.get_help_record(ctx)[1] == 'New help.  [default: 1]'
+
+
+def test_argument_help_record_reflects_context_settings():
+    arg = cloup.Argument(['arg'], help='Help.', required=False)
+    cmd = cloup.Command('cmd', params=[arg])
+
+    assert arg.get_help_record(cloup.Context(cmd))[1] == 'Help.  [optional]'
+    assert arg.get_help_record(cloup.Context(cmd, tag_optional_arguments=False))[1] == 'Help.'
+
+
+@pytest.mark.parametrize('param_cls', [cloup.Argument, cloup.Option])
+def test_help_record_describes_number_range(param_cls):
+    decl = 'arg' if param_cls is cloup.Argument else '--opt'
+    param = param_cls([decl], type=cloup.IntRange(1, 5), required=True)
+    cmd = cloup.Command('cmd', params=[param])
+    ctx = cloup.Context(cmd, tag_required_options=False)
+    assert param.get_help_record(ctx)[1] == '[1<=x<=5]'
+
+
+@pytest.mark.parametrize('param_cls', [cloup.Argument, cloup.Option])
+def test_help_record_shows_dynamic_default(param_cls):
+    decl = 'arg' if param_cls is cloup.Argument else '--opt'
+    param = param_cls([decl], default=lambda: 1, show_default=True, required=False)
+    cmd = cloup.Command('cmd', params=[param])
+    ctx = cloup.Context(cmd, tag_optional_arguments=False)
+    assert param.get_help_record(ctx)[1] == '[default: (dynamic)]'
+
+
+@pytest.mark.parametrize(
+    'show_default, expected_help',
+    [
+        pytest.param(False, 'Help.', id='hidden'),
+        pytest.param('custom', 'Help.  [default: (custom)]', id='custom_string'),
+        pytest.param(True, 'Help.  [default: 1]', id='shown'),
+    ],
+)
+def test_help_shows_default_only_as_requested(runner, show_default, expected_help):
+    @cloup.command()
+    @cloup.option('--opt', default=1, show_default=show_default, help='Help.')
+    def cmd(opt):
+        pass
+
+    res = runner.invoke(cmd, ['--help'])
+    assert res.exit_code == 0, res.output
+    assert f'--opt INTEGER  {expected_help}\n' in res.output
+
+
+@pytest.mark.parametrize('decls', [['-m', '--many'], ['--many', '-m'], ['-m']])
+def test_option_with_arbitrary_nargs_works_with_any_declaration_order(runner, decls):
+    @cloup.command()
+    @cloup.option(*decls, 'many', nargs=-1, type=cloup.Choice(['a', 'b']))
+    def cmd(many):
+        print(many)
+
+    res = runner.invoke(cmd, ['-m', 'a', 'b'])
+    assert res.exit_code == 0, res.output
+    assert res.output == "('a', 'b')\n"
+
+
+def test_option_with_arbitrary_nargs_returns_original_choices(runner):
+    @cloup.command(context_settings=dict(token_normalize_func=lambda s: s.replace('_', '-')))
+    @cloup.option('--many', nargs=-1, type=cloup.Choice(['Foo', 'bar-baz'], case_sensitive=False))
+    def cmd(many):
+        print(many)
+
+    res = runner.invoke(cmd, ['--many', 'FOO', 'Bar_Baz', 'foo'])
+    assert res.exit_code == 0, res.output
+    assert res.output == "('Foo', 'bar-baz', 'Foo')\n"
+
+    res = runner.invoke(cmd, ['--many', 'foo', 'qux'])
+    assert res.exit_code == 2
+    assert 'invalid choice: qux' in res.output
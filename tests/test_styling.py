@@ -17,6 +17,14 @@ def test_help_theme_copywith():
     assert theme == HelpTheme(heading=s1, col1=r1, col2=r2)
 
 
+def test_help_theme_copywith_alias_secondary():
+    s1, s2 = Style(), Style()
+    theme = HelpTheme(alias=s1, alias_secondary=s2)
+    assert theme.with_() is theme
+    assert theme.with_(alias=s2).alias_secondary is s2
+    assert theme.with_(alias_secondary=None).alias_secondary is None
+
+
 def test_help_theme_copywith_takes_the_same_parameters_of_constructor():
     def get_param_names(func):
         params = inspect.signature(func).parameters
@@ -38,6 +46,20 @@ def test_style():
     assert Style(**kwargs)(text) == click.style(text, **kwargs)
 
 
+def test_style_with_text_transform():
+    style = Style(fg=Color.green, text_transform=str.upper)
+    assert style('hi') == click.style('HI', fg='green')
+    assert style == Style(fg=Color.green, text_transform=str.upper)
+
+
+def test_style_output_is_stable_across_many_calls():
+    style = Style(bold=True, text_transform=str.upper)
+    texts = [f'text-{i}' for i in range(600)]
+    for _ in range(2):
+        for text in texts:
+            assert style(text) == click.style(text.upper(), bold=True)
+
+
 def test_unsupported_style_args_are_ignored_in_click_7():
     Style(overline=True, italic=True, strikethrough=True)
 
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import pathlib
+import sys
+from datetime import datetime
 
 import click
+import pytest
 
 import cloup
 
@@ -27,3 +30,115 @@ def test_file_path():
     assert p.type == pathlib.Path
     assert not p.dir_okay
     assert p.file_okay
+
+
+@pytest.mark.parametrize('case_sensitive', [True, False])
+def test_choice_returns_original_choice(case_sensitive):
+    choice = cloup.Choice(['Foo', 'bar'], case_sensitive=case_sensitive)
+    assert choice.convert('Foo', None, None) == 'Foo'
+    if case_sensitive:
+        with pytest.raises(click.BadParameter, match='invalid choice: FOO'):
+            choice.convert('FOO', None, None)
+    else:
+        assert choice.convert('FOO', None, None) == 'Foo'
+
+
+def test_choice_with_token_normalize_func():
+    choice = cloup.Choice(['Foo', 'bar'], case_sensitive=False)
+    cmd = cloup.Command('cmd')
+    ctx = cloup.Context(cmd, token_normalize_func=lambda s: s.replace('-', ''))
+    assert choice.convert('F-OO', None, ctx) == 'Foo'
+    assert choice.convert('bar', None, None) == 'bar'
+
+
+def test_json_from_string_and_path(tmp_path):
+    json_file = tmp_path / 'data.json'
+    json_file.write_text('{"a": 1}')
+    json_type = cloup.JSON(type=dict, path_ok=True)
+    assert json_type.convert(str(json_file), None, None) == {'a': 1}
+    assert json_type.convert('{"b": 2}', None, None) == {'b': 2}
+    with pytest.raises(click.BadParameter, match='must be of type'):
+        json_type.convert('[1]', None, None)
+
+
+def test_datetime_with_dateutil_fails_on_construction_if_not_installed(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'dateutil.parser', None)
+    with pytest.raises(ImportError, match='python-dateutil must be installed'):
+        cloup.DateTime(use_dateutil=True)
+
+
+def test_datetime_uses_first_matching_format():
+    dt_type = cloup.DateTime(formats=['%Y-%m-%d', '%Y-%d-%m'])
+    assert dt_type.convert('2020-01-02', None, None) == datetime(2020, 1, 2)
+    assert dt_type.convert('2020-01-02', None, None) == datetime(2020, 1, 2)
+    assert dt_type.convert('2020-31-01', None, None) == datetime(2020, 1, 31)
+    with pytest.raises(click.BadParameter, match='does not match the formats'):
+        dt_type.convert('01/02/2020', None, None)
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        pytest.param('2020-01-02', datetime(2020, 1, 2), id='date'),
+        pytest.param('2020-01-02T03:04:05', datetime(2020, 1, 2, 3, 4, 5), id='T'),
+        pytest.param('2020-01-02 03:04:05', datetime(2020, 1, 2, 3, 4, 5), id='space'),
+        pytest.param('2020-1-2', datetime(2020, 1, 2), id='no_padding'),
+    ],
+)
+def test_datetime_with_default_formats(value, expected):
+    assert cloup.DateTime().convert(value, None, None) == expected
+
+
+@pytest.mark.parametrize('value', ['20200102', '2020-13-02', '2020-01-02T03:04:05+01:00'])
+def test_datetime_with_default_formats_rejects_other_iso_formats(value):
+    with pytest.raises(click.BadParameter):
+        cloup.DateTime().convert(value, None, None)
+
+
+def test_path_shortcuts_forward_arguments():
+    p = cloup.file_path(exists=True, writable=True, resolve_path=True, allow_dash=True)
+    assert (p.exists, p.writable, p.resolve_path, p.allow_dash) == (True, True, True, True)
+    assert p.readable
+
+
+def test_integer():
+    assert cloup.Integer(base=16).convert('ff', None, None) == 255
+    assert cloup.Integer(base=16, as_str=True).convert('ff', None, None) == 'ff'
+    with pytest.raises(click.BadParameter, match='is not a valid integer'):
+        cloup.Integer().convert('ff', None, None)
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        pytest.param(' {"a": [1]}', {'a': [1]}, id='object'),
+        pytest.param('[1, 2]', [1, 2], id='array'),
+        pytest.param('"text"', 'text', id='string'),
+        pytest.param('3', 3, id='number'),
+    ],
+)
+def test_json_with_path_ok_parses_inline_json(value, expected):
+    assert cloup.JSON(path_ok=True).convert(value, None, None) == expected
+
+
+def test_json_with_path_ok_falls_back_to_path(tmp_path, monkeypatch):
+    json_file = tmp_path / '[draft].json'
+    json_file.write_text('[1, 2]')
+    monkeypatch.chdir(tmp_path)
+    assert cloup.JSON(path_ok=True).convert('[draft].json', None, None) == [1, 2]
+
+
+def test_choice_follows_the_token_normalize_func_of_each_context():
+    choice = cloup.Choice(['foo-bar', 'baz'])
+    cmd = cloup.Command('cmd')
+    strip_dashes = cloup.Context(cmd, token_normalize_func=lambda s: s.replace('-', ''))
+    lower = cloup.Context(cmd, token_normalize_func=str.lower)
+
+    assert choice.convert('foobar', None, strip_dashes) == 'foo-bar'
+    assert choice.convert('foo--bar', None, strip_dashes) == 'foo-bar'
+    assert choice.convert('FOO-BAR', None, lower) == 'foo-bar'
+    with pytest.raises(click.BadParameter, match='invalid choice: foobar'):
+        choice.convert('foobar', None, lower)
+    assert choice.convert('foobar', None, strip_dashes) == 'foo-bar'
+    with pytest.raises(click.BadParameter, match='invalid choice: FOO-BAR'):
+        choice.convert('FOO-BAR', None, None)
@@ -4,6 +4,7 @@ import pytest
 
 from cloup._util import check_positive_int
 from cloup._util import coalesce
+from cloup._util import collapse_sgr
 from cloup._util import first_bool
 from cloup._util import make_repr
 
@@ -48,3 +49,19 @@ def test_coalesce():
     assert coalesce(None, None, None) is None
     for expected in [0, '', [], False, 123]:
         assert coalesce(None, None, expected, True, 12) == expected
+
+
+@pytest.mark.parametrize(
+    'text, expected',
+    [
+        pytest.param('plain', 'plain', id='no_sgr'),
+        pytest.param('\x1b[33mx\x1b[0m', '\x1b[33mx\x1b[0m', id='single'),
+        pytest.param('\x1b[33m\x1b[1mx', '\x1b[33;1mx', id='merge'),
+        pytest.param('x\x1b[0m\x1b[33my', 'x\x1b[0;33my', id='reset_then_set'),
+        pytest.param('\x1b[1m\x1b[0m\x1b[33mx', '\x1b[0;33mx', id='drop_before_reset'),
+        pytest.param('\x1b[38;5;0m\x1b[1mx', '\x1b[38;5;0;1mx', id='extended_color'),
+        pytest.param('x\x1b[0m\x1b[m', 'x\x1b[0m', id='empty_reset'),
+    ],
+)
+def test_collapse_sgr(text, expected):
+    assert collapse_sgr(text) == expected